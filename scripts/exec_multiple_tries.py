@@ -1,11 +1,16 @@
 import shutil
 import subprocess
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Define the directories
 out_dir = "out"
 results_dir = "results"
 
+# Number of tries to run at the same time, each in its own output directory
+parallel_tries = max(1, os.cpu_count() // 2)
+
 # Create the results directory if it doesn't exist
 if not os.path.exists(results_dir):
     os.makedirs(results_dir)
@@ -18,43 +23,80 @@ def clear_directory(directory):
     os.makedirs(directory)
 
 
-# Function to run the cargo command
-def run_cargo():
+# Function to run the cargo command, writing its results to try_out_dir
+def run_cargo(try_out_dir, try_index):
     command = ["cargo", "run", "--release"]
     process = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "OUTPUT_DIR": try_out_dir},
     )
 
-    # Read output line by line as it becomes available
-    for line in iter(process.stdout.readline, ""):
-        print(line.strip())
+    # Print output as it becomes available, in the background so that
+    # stderr is drained at the same time and neither pipe can fill up
+    printer = threading.Thread(
+        target=lambda: [
+            print(f"[try {try_index + 1}] {line.strip()}") for line in process.stdout
+        ],
+        daemon=True,
+    )
+    printer.start()
+    stderr = process.stderr.read()
 
     # Ensure the process has finished
+    printer.join()
     process.stdout.close()
     process.wait()
 
     # Check if there was any error output
-    stderr = process.stderr.read()
     if stderr:
-        print("stderr:", stderr.strip())
+        print(f"[try {try_index + 1}] stderr:", stderr.strip())
 
     return process.returncode == 0
 
 
+# Function to hard link a file, copying it if that is not possible
+# (e.g. the results directory is on another file system)
+def link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 # Function to copy the output directory
-def copy_out_directory(try_index):
+def copy_out_directory(try_out_dir, try_index):
+    # Output directories are cleared before they are written again,
+    # so the results can share their files instead of duplicating them
     destination_dir = os.path.join(results_dir, f"out_{try_index}")
-    shutil.copytree(out_dir, destination_dir)
+    shutil.copytree(
+        try_out_dir, destination_dir, copy_function=link_or_copy, dirs_exist_ok=True
+    )
+
+
+# Function to run one try in its own output directory
+def run_try(try_index):
+    try_out_dir = os.path.join(out_dir, f"try_{try_index}")
+    clear_directory(try_out_dir)
+
+    if not run_cargo(try_out_dir, try_index):
+        return False
+    copy_out_directory(try_out_dir, try_index)
+    return True
+
 
+# Build once, so that the parallel runs do not all wait on the same build
+subprocess.run(["cargo", "build", "--release"], check=True)
 
 # Main loop to execute the process 50 times
-for try_index in range(50):
-    clear_directory(out_dir)
-
-    if run_cargo():
-        copy_out_directory(try_index)
-    else:
-        print(f"Cargo run failed on try {try_index + 1}")
-        break
+with ThreadPoolExecutor(max_workers=parallel_tries) as executor:
+    tries = {executor.submit(run_try, try_index): try_index for try_index in range(50)}
+    for future in as_completed(tries):
+        if not future.result():
+            print(f"Cargo run failed on try {tries[future] + 1}")
+            executor.shutdown(cancel_futures=True)
+            break
 
 print("Process completed.")
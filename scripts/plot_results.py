@@ -1,103 +1,100 @@
-from genericpath import isfile
-from os import listdir
+import argparse
+import os
+from collections import Counter
 import matplotlib.pyplot as plt
-import numpy as np
 import seaborn as sns
 import pandas as pd
+from trials import METRICS, cached_plot, load_trials, store_plot
 
-TOTAL_TRIALS = 50
-placebo_data_150 = []
-best_data_150 = []
-placebo_data_250 = []
-best_data_250 = []
-
-
-def read():
-    def collect_data(lines):
-        res = []
-        for line in lines:
-            parts = line.split(" ")
-            reward = int(float(parts[2][:-1]))
-            mode_changes = int(parts[7][:-1])
-            task_kills = int(parts[15][:-1])
-            task_starts = int(parts[18][:-1])
-            res.append([reward, mode_changes, task_kills, task_starts])
-        return res
-
-    for path in ["results_150", "results_250"]:
-        for i in range(0, TOTAL_TRIALS):
-            trial_data = []
-            dir_path = f"{path}/out_{i}"
-            files = [
-                f"{dir_path}/{f}"
-                for f in listdir(dir_path)
-                if isfile(f"{dir_path}/{f}")
-            ]
-            for file in files:
-                with open(file, "r") as f:
-                    lines = f.readlines()
-                    data = collect_data(lines[1:])
-                    placebo_data = (
-                        placebo_data_150 if "150" in dir_path else placebo_data_250
-                    )
-                    if "placebo" in file:
-                        placebo_data.append(data)
-                    else:
-                        trial_data.append(data)
-
-            # find trial with best reward and its index
-            best_trial = max(trial_data, key=lambda x: sum(a[0] for a in x))
-            best_trial_index = trial_data.index(best_trial)
-
-            best_data = best_data_150 if "150" in dir_path else best_data_250
-            best_data.append(best_trial)
-
-    for i in range(0, TOTAL_TRIALS):
-        print(f"Trial {i} - Placebo: {placebo_data[i]}, Best: {best_data[i]}")
-
-
-def plot_data(index: int, label: str):
-    # Prepare data for seaborn
-    def prepare_data(ranges, label, runnable_count):
-        """Convert the list of lists into a DataFrame for seaborn"""
-        data = []
-        for i, trial in enumerate(ranges):
-            for value in trial:
-                data.append(
-                    {
-                        "Trial": f"{i+1}",
-                        "Value": value,
-                        "Type": label,
-                        "Runnables": runnable_count,
-                    }
-                )
-        return pd.DataFrame(data)
-
-    # Data extraction
-    y_placebo_150 = [[entry[index] for entry in trial] for trial in placebo_data_150]
-    y_best_150 = [[entry[index] for entry in trial] for trial in best_data_150]
-    y_placebo_250 = [[entry[index] for entry in trial] for trial in placebo_data_250]
-    y_best_250 = [[entry[index] for entry in trial] for trial in best_data_250]
-
-    # Create DataFrames
-    placebo_df_150 = prepare_data(y_placebo_150, "AMC+", 150)
-    best_df_150 = prepare_data(y_best_150, "Enhanced", 150)
-    placebo_df_250 = prepare_data(y_placebo_250, "AMC+", 250)
-    best_df_250 = prepare_data(y_best_250, "Enhanced", 250)
-
-    # Combine DataFrames
-    combined_df = pd.concat([placebo_df_150, best_df_150, placebo_df_250, best_df_250])
+PALETTE = {"AMC+": "red", "Enhanced": "green"}
 
-    # Calculate the extremes and quantiles
-    stats = combined_df.groupby(["Runnables", "Type"])["Value"].describe(
-        percentiles=[0.25, 0.5, 0.75]
+
+def boxplot_rc(font_size):
+    # Bigger fonts for the box plots, leaving the hyperparameter charts as they are
+    return {
+        "axes.labelsize": font_size,
+        "xtick.labelsize": font_size,
+        "ytick.labelsize": font_size,
+        "legend.fontsize": font_size,
+        "legend.title_fontsize": font_size,
+    }
+
+
+def collect_hiperparams(line):
+    parts = [part.split(":")[-1] for part in line.split(";")]
+    hidden_sizes = len(eval(parts[0]))
+    sample_batch_size = int(parts[1])
+    activation_function = parts[2]
+    return [hidden_sizes, sample_batch_size, activation_function]
+
+
+def print_runs(runs):
+    for i, trial in runs.groupby("trial"):
+        placebo = trial.loc[trial["Type"] == "AMC+", METRICS].values.tolist()
+        best = trial.loc[trial["Type"] == "Enhanced", METRICS].values.tolist()
+        print(f"Trial {i} - Placebo: {placebo}, Best: {best}")
+
+
+def read_task_sets(root, trials):
+    runs = load_trials(root, trials)
+    print_runs(runs)
+
+    best_hiperparams = []
+    for best_file in runs.loc[runs["Type"] == "Enhanced", "file"].unique():
+        with open(best_file, "r") as f:
+            best_hiperparams.append(collect_hiperparams(f.readline()))
+
+    return runs, best_hiperparams
+
+
+def read_runnables(roots, trials):
+    runs = []
+    for root in roots:
+        # Roots are named after their number of runnables, e.g. results_150
+        runnables = int(root.rstrip("/").rsplit("_", 1)[-1])
+        root_runs = load_trials(root, trials)
+        print_runs(root_runs)
+        runs.append(root_runs.assign(Runnables=runnables))
+
+    return pd.concat(runs)
+
+
+def plot_data(fig, ax, runs, x, label: str, xlabel, plot_file, **legend):
+    # Skip rendering if this data was already plotted
+    entry, restored = cached_plot(plot_file, runs[[x, "Type", label]])
+    if restored:
+        return
+
+    # Create the box plot, reusing the axes of the previous one
+    ax.clear()
+    sns.boxplot(
+        x=x,
+        y=label,  # y-axis shows the distribution of values
+        hue="Type",  # hue creates the subcolumns for AMC+ and Enhanced
+        hue_order=list(PALETTE),
+        data=runs,
+        palette=PALETTE,
+        ax=ax,
     )
 
-    # Prepare the output directory
-    import os
+    # Add titles and labels
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(label)
+    ax.legend(title="Schedule", **legend)
+
+    # Display the plot
+    fig.tight_layout()
+
+    # Save the plot to a file
+    fig.savefig(plot_file)
+    store_plot(plot_file, entry)
+
 
-    output_dir = "results"
-    os.makedirs(output_dir, exist_ok=True)
+def write_stats(runs, label: str, output_dir):
+    # Calculate the extremes and quantiles
+    stats = runs.groupby(["Runnables", "Type"])[label].describe(
+        percentiles=[0.25, 0.5, 0.75]
+    )
 
     # Write the stats to a text file
     stats_file = os.path.join(output_dir, f"cmp_stats_{label}.txt")
@@ -107,37 +104,117 @@ def plot_data(index: int, label: str):
         f.write(stats[["min", "25%", "50%", "75%", "max"]].to_string())
         f.write("\n\n")
 
-    # Create the box plot
-    plt.figure(figsize=(10, 10))
-    sns.boxplot(
-        x="Runnables",  # x-axis shows the number of runnables (150 and 250)
-        y="Value",  # y-axis shows the distribution of values
-        hue="Type",  # hue creates the subcolumns for AMC+ and Enhanced
-        data=combined_df,
-        palette={"AMC+": "red", "Enhanced": "green"},
+
+def plot_best_hiperparameters(best_hiperparams, output_dir):
+    # Extract the values for each hyperparameter
+    hidden_sizes = [hp[0] for hp in best_hiperparams]
+    batch_sizes = [hp[1] for hp in best_hiperparams]
+    activation_functions = [hp[2] for hp in best_hiperparams]
+
+    # Count the occurrences of each value
+    hidden_sizes_count = Counter(hidden_sizes)
+    batch_sizes_count = Counter(batch_sizes)
+    activation_functions_count = Counter(activation_functions)
+
+    def save_bar_chart(data, title, xlabel, ylabel, filename):
+        plt.figure(figsize=(6, 6))
+        plt.rcParams.update({"font.size": 30})
+        plt.bar(data.keys(), data.values())
+        # plt.xlabel(xlabel)
+        plt.ylabel(ylabel)
+        plt.xticks(list(data.keys()))
+        plt.tight_layout()
+        plt.savefig(filename)
+        plt.close()
+
+    # Save each graph to disk
+    save_bar_chart(
+        hidden_sizes_count,
+        "Hidden Sizes",
+        "Hidden Size",
+        "Count",
+        os.path.join(output_dir, "hidden_sizes_count.png"),
+    )
+    save_bar_chart(
+        batch_sizes_count,
+        "Batch Sizes",
+        "Batch Size",
+        "Count",
+        os.path.join(output_dir, "batch_sizes_count.png"),
+    )
+    save_bar_chart(
+        activation_functions_count,
+        "Activation Functions",
+        "Activation Function",
+        "Count",
+        os.path.join(output_dir, "activation_functions_count.png"),
     )
 
-    # Add titles and labels
-    plt.xlabel("Number of Runnables")
-    plt.ylabel(label)
-    plt.legend(title="Schedule")
 
-    # Display the plot
-    plt.tight_layout()
+def plot_task_sets(args):
+    runs, best_hiperparams = read_task_sets(args.task_sets, args.trials)
+    plot_best_hiperparameters(best_hiperparams, args.outdir)
 
-    # Make font bigger
-    plt.rc("axes", labelsize=18)
-    plt.rc("xtick", labelsize=18)
-    plt.rc("ytick", labelsize=18)
-    plt.rc("legend", fontsize=18)
-    plt.rc("legend", title_fontsize=18)
+    with plt.rc_context(boxplot_rc(args.font_size)):
+        fig, ax = plt.subplots(figsize=(10, 10))
+        for label in METRICS:
+            plot_file = os.path.join(args.outdir, f"{label}.png")
+            plot_data(
+                fig, ax, runs, "Trial", label, "Task Set", plot_file, loc="upper right"
+            )
+        plt.close(fig)
 
-    # Save the plot to a file
-    plt.savefig(f"results/{label}_comparison.png")
+
+def plot_runnables(args):
+    runs = read_runnables(args.runnables, args.trials)
+
+    with plt.rc_context(boxplot_rc(args.font_size)):
+        fig, ax = plt.subplots(figsize=(10, 10))
+        for label in METRICS:
+            write_stats(runs, label, args.outdir)
+            plot_file = os.path.join(args.outdir, f"{label}_comparison.png")
+            plot_data(
+                fig, ax, runs, "Runnables", label, "Number of Runnables", plot_file
+            )
+        plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Plot AMC+ against the best tested model, from the results "
+        "gathered by exec_multiple_tries.py"
+    )
+    parser.add_argument(
+        "--task-sets",
+        metavar="ROOT",
+        help="compare each task set under ROOT, and count the best hyperparameters",
+    )
+    parser.add_argument(
+        "--runnables",
+        metavar="ROOT",
+        nargs="+",
+        help="compare by number of runnables, one ROOT per count (e.g. results_150)",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        help="number of out_{i} directories to read per ROOT (default: all)",
+    )
+    parser.add_argument("--font-size", type=int, default=18)
+    parser.add_argument("--outdir", default="results")
+    args = parser.parse_args()
+    if not args.task_sets and not args.runnables:
+        parser.error("nothing to plot, give --task-sets and/or --runnables")
+
+    os.makedirs(args.outdir, exist_ok=True)
+
+    if args.task_sets:
+        # The bar charts change the rc parameters, keep that to the task set plots
+        with plt.rc_context():
+            plot_task_sets(args)
+    if args.runnables:
+        plot_runnables(args)
 
 
-read()
-plot_data(0, "Reward")
-plot_data(1, "Mode Changes")
-plot_data(2, "Task Kills")
-plot_data(3, "Task Starts")
+if __name__ == "__main__":
+    main()
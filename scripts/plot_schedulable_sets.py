@@ -1,53 +1,14 @@
-data = [
-    1.0,
-    1.0,
-    1.0,
-    1.0,
-    1.0,
-    1.0,
-    1.0,
-    0.998,
-    1.0,
-    0.996,
-    0.992,
-    0.982,
-    0.972,
-    0.928,
-    0.922,
-    0.85,
-    0.782,
-    0.748,
-    0.664,
-    0.62,
-    0.522,
-    0.458,
-    0.386,
-    0.316,
-    0.258,
-    0.174,
-    0.168,
-    0.082,
-    0.05,
-    0.04,
-    0.042,
-    0.018,
-    0.014,
-    0.004,
-    0.002,
-    0.002,
-    0.0,
-    0.002,
-    0.002,
-    0.0,
-]
-data = [x * 100 for x in data]
-data = data[5:]
-data = data[:-5]
-
+import os
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
+# Fraction of schedulable task sets for 10 to 400 runnables, in steps of 10
+data = np.load(os.path.join(os.path.dirname(__file__), "schedulable_sets.npy"))
+data = data * 100
+data = data[5:]
+data = data[:-5]
+
 num_runnables = np.arange(60, 360, step=10)
 
 plt.rcParams.update({"font.size": 18})
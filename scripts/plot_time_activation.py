@@ -1,15 +1,10 @@
 from matplotlib import pyplot as plt
+import numpy as np
 
-# Initialize a dictionary to hold time data for each case
-time_data_dict = {1: [], 3: []}
-
-# Read and store the time data for each hidden layer configuration
-for i in [1, 3]:
-    with open(f"results/activation_times_{i}.txt", "r") as f:
-        lines = f.readlines()
-        for line in lines:
-            parts = line.split(" ")
-            time_data_dict[i].append(float(parts[0]) / 1000)
+# Read the time data for each hidden layer configuration
+time_data_dict = {
+    i: np.loadtxt(f"results/activation_times_{i}.txt", usecols=0) / 1000 for i in [1, 3]
+}
 
 plt.rcParams.update({"font.size": 24})
 
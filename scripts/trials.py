@@ -0,0 +1,145 @@
+import hashlib
+import math
+import os
+import re
+import shutil
+import sys
+from collections import defaultdict
+from multiprocessing import Pool
+import matplotlib.pyplot as plt
+import pandas as pd
+
+CACHE_DIR = "results/.cache"
+CACHE_ENTRIES = 8
+CACHE_VERSION = 2
+PLOT_CACHE_DIR = "results/.plotcache"
+PLOT_CACHE_ENTRIES = 32
+
+METRICS = ["Reward", "Mode Changes", "Task Kills", "Task Starts"]
+
+# A results line, capturing each metric in order; header lines never match
+RESULTS_LINE = re.compile(
+    r"^Cumulative reward: (\S+); mode changes to H: (\d+); mode changes to L: \d+; "
+    r"task kills: (\d+), task starts: (\d+)$",
+    re.MULTILINE,
+)
+
+
+def read_results(file):
+    """Parse the results lines of a file into a DataFrame"""
+    with open(file, "r") as f:
+        rows = RESULTS_LINE.findall(f.read())
+    return pd.DataFrame(rows, columns=METRICS).astype(float).astype(int)
+
+
+def read_trial(files):
+    """Parse the placebo and the best test of a trial, tagging each row with its file.
+
+    Tests are compared by cumulative reward as they are parsed, so only the best
+    one so far is kept in memory.
+    """
+    placebo = []
+    best, best_reward = None, -math.inf
+    for file in files:
+        data = read_results(file).assign(file=file)
+        if "placebo" in file:
+            placebo.append(data)
+            continue
+
+        reward = data["Reward"].sum()
+        if reward > best_reward:
+            best, best_reward = data, reward
+
+    return pd.concat(
+        [data.assign(Type="AMC+") for data in placebo] + [best.assign(Type="Enhanced")]
+    )
+
+
+def evict_cache(cache_dir, max_entries):
+    # Keep only the most recently used entries
+    with os.scandir(cache_dir) as it:
+        entries = sorted(it, key=lambda e: e.stat().st_mtime, reverse=True)
+    for entry in entries[max_entries:]:
+        os.remove(entry.path)
+
+
+def load_trials(root, total_trials=None):
+    """Parse the out_{i} directories under root into long-form data for seaborn.
+
+    Only the placebo runs (Type AMC+) and the runs of the best test (Type
+    Enhanced) of each trial are kept, with the trial index and its 1-based
+    Trial label. All out_{i} directories are read unless total_trials is given.
+    Trials are parsed in parallel and cached in CACHE_DIR, keyed by the name
+    and last modified time of every results file, so unchanged results are
+    only parsed once.
+    """
+    # List every trial directory in a single pass over root
+    listing = defaultdict(list)
+    for dir_path, dirs, files in os.walk(root):
+        if dir_path == root:
+            dirs[:] = [d for d in dirs if d.startswith("out_")]
+        for file in files:
+            listing[os.path.basename(dir_path)].append(os.path.join(dir_path, file))
+
+    if total_trials is None:
+        total_trials = 0
+        while f"out_{total_trials}" in listing:
+            total_trials += 1
+
+    trial_files = []
+    for i in range(total_trials):
+        if f"out_{i}" not in listing:
+            raise FileNotFoundError(f"{root}/out_{i}")
+        trial_files.append(sorted(listing[f"out_{i}"]))
+
+    all_files = [file for files in trial_files for file in files]
+    key = (
+        CACHE_VERSION,
+        root,
+        tuple(sorted((f, os.path.getmtime(f)) for f in all_files)),
+    )
+    cache_file = f"{CACHE_DIR}/{hashlib.sha1(repr(key).encode()).hexdigest()}.parquet"
+
+    if os.path.exists(cache_file):
+        os.utime(cache_file)
+        return pd.read_parquet(cache_file)
+
+    # Trials are independent, so parse them in separate processes
+    with Pool() as pool:
+        trials = pool.map(read_trial, trial_files)
+    data = pd.concat(
+        [trial.assign(trial=i, Trial=f"{i+1}") for i, trial in enumerate(trials)],
+        ignore_index=True,
+    )
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    data.to_parquet(cache_file)
+    evict_cache(CACHE_DIR, CACHE_ENTRIES)
+    return data
+
+
+def cached_plot(plot_file, data):
+    """Find the cache entry for plotting data to plot_file, restoring it if rendered.
+
+    Entries are keyed on the plotted data, the output file, the plotting script
+    and the current rc parameters, so changing any of them renders the plot anew.
+    Returns the entry and whether plot_file was restored from it.
+    """
+    key = hashlib.md5(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    key.update(repr((plot_file, list(data.columns))).encode())
+    with open(sys.modules["__main__"].__file__, "rb") as f:
+        key.update(f.read())
+    key.update(repr(sorted(plt.rcParams.items())).encode())
+
+    entry = f"{PLOT_CACHE_DIR}/{key.hexdigest()}.png"
+    if not os.path.exists(entry):
+        return entry, False
+    os.utime(entry)
+    shutil.copy(entry, plot_file)
+    return entry, True
+
+
+def store_plot(plot_file, entry):
+    """Save the rendered plot_file as a cache entry"""
+    os.makedirs(PLOT_CACHE_DIR, exist_ok=True)
+    shutil.copy(plot_file, entry)
+    evict_cache(PLOT_CACHE_DIR, PLOT_CACHE_ENTRIES)
@@ -24,7 +24,7 @@ fn write_result(agent: &SimulatorAgent, file: &mut std::fs::File) {
     file.write_all(contents.as_bytes()).unwrap();
 }
 
-fn tune(tasks: Vec<SimulatorTask>) {
+fn tune(tasks: Vec<SimulatorTask>, out_dir: &str) {
     let train_instants: u64 = Runnable::duration_to_time_unit(Duration::from_secs(
         std::env::var("TRAIN_INSTANTS")
             .expect("TRAIN_INSTANTS not set")
@@ -56,7 +56,7 @@ fn tune(tasks: Vec<SimulatorTask>) {
         let mut file = std::fs::OpenOptions::new()
             .append(true)
             .create(true)
-            .open("out/placebo.txt")
+            .open(format!("{out_dir}/placebo.txt"))
             .unwrap();
         file.set_len(0).unwrap();
         file.write_all(
@@ -105,6 +105,7 @@ fn tune(tasks: Vec<SimulatorTask>) {
             let tasks = tasks.clone();
             let hidden_sizes = hidden_sizes.clone();
             let tx = tx.clone();
+            let out_dir = out_dir.to_owned();
 
             pool.execute(move || {
                     let agent = Rc::new(RefCell::new(SimulatorAgent::new(
@@ -131,7 +132,7 @@ fn tune(tasks: Vec<SimulatorTask>) {
                         let mut file = std::fs::OpenOptions::new()
                         .append(true)
                         .create(true)
-                        .open(format!("out/test_{hyper_iteration}.txt"))
+                        .open(format!("{out_dir}/test_{hyper_iteration}.txt"))
                         .unwrap();
                     file.set_len(0).unwrap();
                     file.write_all(format!("hidden sizes: {:?}; sample batch size: {}; activation function: {:?}\n", hidden_sizes, sample_batch_size, ActivationFunction::ReLU).as_bytes()).unwrap();
@@ -153,12 +154,12 @@ fn tune(tasks: Vec<SimulatorTask>) {
     }
 }
 
-pub fn hp_tuning(number_runnables: usize) {
-    std::fs::create_dir_all("out").unwrap();
+pub fn hp_tuning(number_runnables: usize, out_dir: &str) {
+    std::fs::create_dir_all(out_dir).unwrap();
     loop {
         let set = generate_tasks(number_runnables);
         if feasible_schedule_design_time(&set) {
-            tune(set.clone());
+            tune(set.clone(), out_dir);
             return;
         }
         println!("Infeasible schedule, retrying...\n");
@@ -171,5 +172,6 @@ fn main() {
             .expect("NUMBER_RUNNABLES not set")
             .parse::<usize>()
             .unwrap(),
+        &std::env::var("OUTPUT_DIR").unwrap_or_else(|_| "out".to_owned()),
     );
 }